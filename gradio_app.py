@@ -11,10 +11,17 @@ Features:
 - Download converted files
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
-import subprocess
+import shutil
 import sys
+import tempfile
 import zipfile
+from contextlib import aclosing
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 
@@ -26,6 +33,17 @@ print(f"Gradio version: {gr.__version__}")
 REPO_ROOT = Path(__file__).resolve().parent
 DEFAULT_OUTPUT_DIR = str(REPO_ROOT / "out")
 CONVERTER_SCRIPT = str(REPO_ROOT / "scripts" / "pdf_to_semantic_html.py")
+BATCH_WORKERS = os.cpu_count() or 1
+STATUS_INTERVAL = 0.1  # Seconds between batch progress updates sent to the browser
+CACHE_DIR = Path(os.environ.get("PDF_CACHE_DIR", "~/.cache/pdf-to-html")).expanduser()
+CACHE_MAX_ENTRIES = int(os.environ.get("PDF_CACHE_MAX_ENTRIES", "256"))
+WORKER_LINE_LIMIT = 16 * 1024 * 1024  # Final replies carry the job's whole stderr
+PREVIEW_CHUNK = 64 * 1024
+PREVIEW_LIMIT = 512 * 1024  # Larger HTML is never usefully visible in the preview box
+APP_CSS = """
+#status-box textarea {font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;}
+""".strip()
+APP_THEME = gr.themes.Soft()
 
 # Set up environment with user's site-packages
 ENV = os.environ.copy()
@@ -35,49 +53,316 @@ if 'PYTHONPATH' in ENV:
 else:
     ENV['PYTHONPATH'] = USER_SITE
 
-def convert_pdf(pdf_path, output_dir, no_images=False, no_toc=False, keep_toc_pages=False):
-    """Run pdf_to_semantic_html.py with custom options."""
-    output_dir = os.path.abspath(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
-
-    cmd = [sys.executable, CONVERTER_SCRIPT, pdf_path, "--out", output_dir]
-
-    if no_images:
-        cmd.append("--no-images")
-    if no_toc:
-        cmd.append("--no-toc")
-    if keep_toc_pages:
-        cmd.append("--keep-toc-pages")
+@dataclass(slots=True)
+class ConvResult:
+    """Outcome of one converter job."""
+    stdout: str
+    stderr: str
+    returncode: int
+    converter_version: int | None = None  # Of the worker that produced the output
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+# Idle `pdf_to_semantic_html.py --server` processes with the converter_version()
+# they started with, reused across conversions so each job skips interpreter
+# startup and the PyMuPDF import.
+_idle_workers = []
+# Caps converter processes across all sessions, not just within one batch
+_worker_slots = asyncio.Semaphore(BATCH_WORKERS)
+
+async def start_worker():
+    """Spawn a converter process that serves JSON jobs over stdin/stdout.
+
+    Returns the process and the converter version it runs. The version is read
+    before spawning, so an edit racing the start at worst labels new code with
+    the old version, which cache lookups (always for the current one) skip.
+    """
+    version = await asyncio.to_thread(converter_version)
+    worker = await asyncio.create_subprocess_exec(
+        sys.executable, CONVERTER_SCRIPT, "--server",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        env=ENV,
+        limit=WORKER_LINE_LIMIT,
+    )
+    return worker, version
+
+async def run_converter(args, on_line=None, max_jobs=1):
+    """Run one converter job (CLI arguments) on a pooled worker process.
+
+    Output lines stream back while the job runs; ``on_line`` is called with
+    each one as it arrives. With ``max_jobs`` > 1 the job also borrows worker
+    slots that are free right now and uses them for page-parallel extraction
+    (``--jobs``), so the total process count stays within BATCH_WORKERS. The
+    worker reports when extraction no longer needs them (immediately for
+    PDFs too small to split), and they are handed back at that point rather
+    than at the end of the job.
+    """
+    async with _worker_slots:
+        borrowed = 0
+        while borrowed < max_jobs - 1 and not _worker_slots.locked():
+            await _worker_slots.acquire()  # Not locked, so this doesn't wait
+            borrowed += 1
+
+        def give_back():
+            nonlocal borrowed
+            for _ in range(borrowed):
+                _worker_slots.release()
+            borrowed = 0
+
+        try:
+            if borrowed:
+                args = [*args, "--jobs", str(borrowed + 1)]
+            return await _run_on_worker(args, on_line, give_back)
+        finally:
+            give_back()
+
+async def _run_on_worker(args, on_line, on_jobs_done):
+    """Send one job to an idle worker (or a new one) and collect its reply."""
+    worker = None
+    while _idle_workers and worker is None:
+        worker, version = _idle_workers.pop()
+        if worker.returncode is not None:
+            worker = None  # Died while idle
+    if worker is None:
+        worker, version = await start_worker()
+
+    lines = []
+    result = None
+    error = None
+    raw = b""
+    try:
+        worker.stdin.write((json.dumps({"argv": args}) + "\n").encode())
+        await worker.stdin.drain()
+        while True:
+            try:
+                raw = await worker.stdout.readline()
+            except ValueError:  # Over WORKER_LINE_LIMIT; the rest of it is still unread
+                error = f"Converter worker sent a reply line over {WORKER_LINE_LIMIT} bytes"
+                break
+            if not raw:
+                break
+            message = json.loads(raw)
+            if "jobs_done" in message:
+                on_jobs_done()
+            elif "line" in message:
+                lines.append(message["line"])
+                if on_line:
+                    on_line(message["line"])
+            else:
+                stdout = "".join(f"{line}\n" for line in lines)
+                result = ConvResult(stdout, message["stderr"], message["returncode"], version)
+                break
+    except ConnectionError:
+        pass
+    except (ValueError, KeyError, TypeError):
+        error = f"Converter worker sent an invalid reply: {raw[:200]!r}"
+    except BaseException:
+        worker.kill()  # Mid-job state is unknown, never reuse it
+        raise
+
+    if error:
+        worker.kill()  # Out of sync with the protocol, never reuse it
+        await worker.wait()
+        stdout = "".join(f"{line}\n" for line in lines)
+        return ConvResult(stdout, error, 1)
+
+    if result is None:
+        returncode = await worker.wait()
+        return ConvResult("", f"Converter worker exited unexpectedly (exit code {returncode})", returncode or 1)
+
+    # The slot semaphore keeps live workers at BATCH_WORKERS, so always keep it
+    _idle_workers.append((worker, version))
+    return result
+
+def converter_version():
+    """Converter script mtime; cache entries are keyed on the version that wrote them."""
+    return os.stat(CONVERTER_SCRIPT).st_mtime_ns
+
+def cache_key(pdf_path, no_images, no_toc, keep_toc_pages):
+    """Hash PDF bytes, file name and flags into a cache key.
+
+    Entries are stored as ``<key>-<converter version>``: idle workers keep
+    running the code they started with, so the version comes from the worker
+    that produced the output, not from the script on disk.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(pdf_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    # The file name ends up in the HTML (title fallback, schema "source").
+    extra = (Path(pdf_path).name, no_images, no_toc, keep_toc_pages)
+    digest.update(repr(extra).encode())
+    return digest.hexdigest()
+
+def copy_output(src_dir, html_path):
+    """Copy a conversion (``output.html`` + ``images/``) from src_dir to html_path."""
+    html_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(src_dir / "output.html", html_path)
+    images_dir = src_dir / "images"
+    if images_dir.is_dir():
+        shutil.copytree(images_dir, html_path.parent / "images", dirs_exist_ok=True)
+
+def restore_from_cache(key, html_path):
+    """Copy a cached conversion (HTML + its images) to html_path. Returns True on hit."""
+    entry = CACHE_DIR / key
+    if not (entry / "output.html").exists():
+        return False
+
+    copy_output(entry, html_path)
+    os.utime(entry)  # Mark as recently used for eviction
+    return True
+
+def new_job_dir():
+    """Private output directory for one conversion, later renamed into the cache.
+
+    Output directories are shared (images are named by page, not by PDF), so
+    only a job's own directory is known to hold just that job's images.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(dir=CACHE_DIR, prefix=".tmp-")).resolve()
+
+def store_in_cache(key, job_dir):
+    """Move a finished job directory into the cache, then evict old entries."""
+    try:
+        os.rename(job_dir, CACHE_DIR / key)
+    except OSError:
+        # Entry already stored by a concurrent job, or disk trouble: the
+        # conversion itself succeeded, so just drop the job directory.
+        shutil.rmtree(job_dir, ignore_errors=True)
+        return
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, env=ENV)
-        return result.stdout, result.stderr, 0
-    except subprocess.CalledProcessError as e:
-        return e.stdout, e.stderr, e.returncode
+        entries = sorted(
+            (entry for entry in CACHE_DIR.iterdir() if entry.is_dir() and not entry.name.startswith(".")),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True
+        )
+    except OSError:
+        return  # Another job is evicting concurrently
+    for stale in entries[CACHE_MAX_ENTRIES:]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+@functools.lru_cache(maxsize=None)
+def converter_flags(no_images, no_toc, keep_toc_pages, progress):
+    """CLI flags for one option combination; only a handful ever occur."""
+    return tuple(
+        flag
+        for flag, enabled in (
+            ("--no-images", no_images),
+            ("--no-toc", no_toc),
+            ("--keep-toc-pages", keep_toc_pages),
+            ("--progress", progress),
+        )
+        if enabled
+    )
 
-def convert_folder(folder_path, output_dir, no_images, no_toc, keep_toc_pages):
-    """Convert all PDFs in a folder."""
+async def convert_pdf(pdf_path, output_dir, no_images=False, no_toc=False, keep_toc_pages=False, html_name=None, jobs=1,
+                      on_line=None):
+    """Run pdf_to_semantic_html.py with custom options.
+
+    When ``html_name`` is given the HTML is written to exactly that file inside
+    ``output_dir``; otherwise the CLI names it after the PDF. ``jobs`` > 1 lets
+    the converter split page extraction of large PDFs across up to that many
+    processes, as far as worker slots are free. With
+    ``on_line`` the converter reports progress, passed on line by line.
+    """
+    # No makedirs here: output is copied into place (creating the directory)
+    # only once a job succeeds, so queued or failed jobs leave nothing behind
     output_dir = os.path.abspath(output_dir)
+    out = os.path.join(output_dir, html_name) if html_name else output_dir
+    flags = converter_flags(bool(no_images), bool(no_toc), bool(keep_toc_pages), bool(on_line))
 
-    cmd = [
-        sys.executable, CONVERTER_SCRIPT, folder_path,
-        "--out", output_dir,
-        "--batch",
-        "--recursive"
-    ]
+    html_path = Path(out) if html_name else Path(output_dir) / f"{Path(pdf_path).stem}.html"
+    try:
+        key = await asyncio.to_thread(cache_key, pdf_path, no_images, no_toc, keep_toc_pages)
+        # Look up what a freshly started worker would produce
+        version = await asyncio.to_thread(converter_version)
+        if await asyncio.to_thread(restore_from_cache, f"{key}-{version}", html_path):
+            return ConvResult(f"Converted (cached): {pdf_path} -> {html_path}\n", "", 0)
+        job_dir = await asyncio.to_thread(new_job_dir)
+    except OSError:
+        # Unreadable input or cache; convert straight into place and let the CLI report it
+        return await run_converter([pdf_path, "--out", out, *flags], on_line, max_jobs=jobs)
+
+    job_html = job_dir / "output.html"
+    try:
+        result = await run_converter([pdf_path, "--out", str(job_html), *flags], on_line, max_jobs=jobs)
+        if result.ok:
+            result.stdout = result.stdout.replace(str(job_html), str(html_path))
+            try:
+                await asyncio.to_thread(copy_output, job_dir, html_path)
+            except OSError as exc:
+                return ConvResult(result.stdout, f"Could not write output: {exc}", 1)
+            await asyncio.to_thread(store_in_cache, f"{key}-{result.converter_version}", job_dir)
+    finally:
+        # Already moved into the cache on success
+        await asyncio.to_thread(shutil.rmtree, job_dir, ignore_errors=True)
+    return result
+
+def find_pdfs(folder_path):
+    """Return all PDFs below a folder, sorted like the CLI's --recursive mode.
+
+    Uses os.scandir so directory entries come with cached type info and only
+    matching PDFs get a Path object.
+    """
+    pdfs = []
+    pending = [folder_path]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except PermissionError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.lower().endswith(".pdf") and entry.is_file():
+                    pdfs.append(entry.path)
+    return [Path(path) for path in sorted(pdfs)]
+
+async def convert_folder(folder_path, pdf_paths, output_dir, no_images, no_toc, keep_toc_pages):
+    """Convert PDFs concurrently, yielding ``(pdf_path, result)`` as each finishes.
+
+    Each PDF gets its own converter process (at most ``BATCH_WORKERS`` at a
+    time) and is written to ``<output_dir>/<relative-dir>/<pdf-name>/index.html``
+    so same-named PDFs in different subfolders don't overwrite each other. A
+    failing file yields its exception instead of aborting the rest of the batch.
+    """
+    output_dir = os.path.abspath(output_dir)
+    targets = {}
 
-    if no_images:
-        cmd.append("--no-images")
-    if no_toc:
-        cmd.append("--no-toc")
-    if keep_toc_pages:
-        cmd.append("--keep-toc-pages")
+    async def one(pdf, target):
+        # Process count is bounded by run_converter's global worker slots
+        try:
+            result = await convert_pdf(
+                str(pdf), target, no_images, no_toc, keep_toc_pages, html_name="index.html"
+            )
+        except Exception as exc:
+            result = exc
+        return pdf, result
+
+    async def collision(pdf, other):
+        return pdf, ValueError(f"same output directory as {other.relative_to(folder_path)}, skipped")
+
+    jobs = []
+    for pdf in pdf_paths:
+        target = os.path.join(output_dir, pdf.relative_to(folder_path).parent, pdf.stem)
+        if target in targets:  # e.g. a.pdf next to a.PDF
+            jobs.append(collision(pdf, targets[target]))
+        else:
+            targets[target] = pdf
+            jobs.append(one(pdf, target))
 
+    tasks = [asyncio.create_task(job) for job in jobs]
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, env=ENV)
-        return result.stdout, result.stderr, 0
-    except subprocess.CalledProcessError as e:
-        return e.stdout, e.stderr, e.returncode
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()  # No-op once finished; stops the rest if the batch is abandoned
 
 def create_ui():
     """Create Gradio interface."""
@@ -172,11 +457,18 @@ Convert PDFs to clean, SEO-optimized HTML with headings, TOC, figures, and schem
                 visible=False
             )
 
+        with gr.Row():
+            html_preview = gr.Code(
+                label="👀 HTML preview",
+                language="html",
+                visible=False
+            )
+
         # Event handlers
         convert_btn.click(
             fn=handle_convert,
             inputs=[pdf_input, output_dir, no_images, no_toc, keep_toc_pages],
-            outputs=[status_output, download_file]
+            outputs=[status_output, download_file, html_preview]
         )
 
         convert_batch_btn.click(
@@ -186,8 +478,8 @@ Convert PDFs to clean, SEO-optimized HTML with headings, TOC, figures, and schem
         )
 
         clear_btn.click(
-            fn=lambda: ("", gr.update(value=None, visible=False)),
-            outputs=[status_output, download_file]
+            fn=lambda: ("", gr.update(value=None, visible=False), gr.update(value=None, visible=False)),
+            outputs=[status_output, download_file, html_preview]
         )
 
     return demo
@@ -216,49 +508,129 @@ def create_zip_with_images(html_file, output_dir_path):
 
     return zip_path
 
-def handle_convert(pdf_file, output_dir, no_images, no_toc, keep_toc_pages):
-    """Handle single PDF conversion."""
+def stat_or_none(path):
+    """Return path.stat(), or None if the file does not exist."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+async def read_preview(html_file):
+    """Yield the growing start of html_file, read in chunks off the event loop."""
+    fh = await asyncio.to_thread(open, html_file, "r", encoding="utf-8", errors="replace")
+    try:
+        chunks = []
+        read = 0
+        while read < PREVIEW_LIMIT:
+            chunk = await asyncio.to_thread(fh.read, PREVIEW_CHUNK)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            read += len(chunk)
+            yield "".join(chunks)[:PREVIEW_LIMIT]
+    finally:
+        fh.close()
+
+async def coalesce(items, interval=STATUS_INTERVAL):
+    """Re-yield an async iterator's items in lists, at most one list per interval.
+
+    Items arriving within ``interval`` of the previous list are held back and
+    sent once the interval has passed, even if nothing else arrives.
+    """
+    loop = asyncio.get_running_loop()
+    last_sent = loop.time()
+    held = []
+    # A single pending __anext__ survives timeouts, so no item is ever dropped
+    next_item = None
+    try:
+        while True:
+            if next_item is None:
+                next_item = asyncio.ensure_future(anext(items))
+            timeout = max(0.0, last_sent + interval - loop.time()) if held else None
+            done, _ = await asyncio.wait({next_item}, timeout=timeout)
+            if done:
+                finished, next_item = next_item, None
+                try:
+                    held.append(finished.result())
+                except StopAsyncIteration:
+                    break
+            if held and loop.time() - last_sent >= interval:
+                yield held
+                held = []
+                last_sent = loop.time()
+        if held:
+            yield held
+    finally:
+        if next_item is not None:
+            next_item.cancel()
+            await asyncio.wait({next_item})
+
+async def handle_convert(pdf_file, output_dir, no_images, no_toc, keep_toc_pages):
+    """Handle single PDF conversion, then stream an HTML preview."""
+    no_preview = gr.update(value=None, visible=False)
     if not pdf_file:
-        return "❌ No PDF file selected", gr.update(value=None, visible=False)
+        yield "❌ No PDF file selected", gr.update(value=None, visible=False), no_preview
+        return
 
     pdf_path = pdf_file.name
-    stdout, stderr, returncode = convert_pdf(pdf_path, output_dir, no_images, no_toc, keep_toc_pages)
+    pdf_name = Path(pdf_path).stem
+    output_dir_path = Path(output_dir.strip() or DEFAULT_OUTPUT_DIR)
+    output_dir = str(output_dir_path)
+    output_file = output_dir_path / f"{pdf_name}.html"
+    # Page-parallel extraction only borrows worker slots that are free; batches
+    # parallelize across files instead
+    progress = asyncio.Queue()
+    task = asyncio.create_task(convert_pdf(
+        pdf_path, output_dir, no_images, no_toc, keep_toc_pages, jobs=BATCH_WORKERS,
+        on_line=progress.put_nowait
+    ))
+    task.add_done_callback(lambda _: progress.put_nowait(None))
+
+    async def progress_lines():
+        while (line := await progress.get()) is not None:
+            yield line
 
-    if returncode != 0:
-        return (
+    try:
+        log_lines = []
+        yield f"⏳ Converting `{pdf_path}`...", gr.update(value=None, visible=False), no_preview
+        async with aclosing(coalesce(progress_lines())) as batches:
+            async for lines in batches:
+                log_lines.extend(lines)
+                log = "\n".join(log_lines)
+                yield f"⏳ Converting `{pdf_path}`...\n\n📝 Log:\n{log}", gr.update(value=None, visible=False), no_preview
+        result = await task
+    finally:
+        task.cancel()  # No-op once finished; stops the job if the user cancels
+
+    if not result.ok:
+        yield (
             "❌ Conversion failed!\n"
             f"📄 Input: `{pdf_path}`\n"
             f"📁 Output dir: `{output_dir}`\n"
-            f"🔴 Exit code: {returncode}\n"
-            f"❓ Error output:\n{stderr}\n"
-            f"📝 Standard output:\n{stdout}"
-        ), gr.update(value=None, visible=False)
+            f"🔴 Exit code: {result.returncode}\n"
+            f"❓ Error output:\n{result.stderr}\n"
+            f"📝 Standard output:\n{result.stdout}"
+        ), gr.update(value=None, visible=False), no_preview
+        return
 
-    output_dir_path = Path(output_dir)
-    pdf_name = Path(pdf_path).stem
-    output_files = sorted(
-        output_dir_path.glob(f"{pdf_name}*.html"),
-        key=lambda item: item.stat().st_mtime,
-        reverse=True
-    )
-    output_file = output_files[0] if output_files else None
+    output_stat = await asyncio.to_thread(stat_or_none, output_file)
 
-    if output_file:
-        file_size = output_file.stat().st_size / 1024
+    if output_stat:
+        file_size = output_stat.st_size / 1024
 
-        # Create ZIP with images if they exist
-        download_file = create_zip_with_images(output_file, output_dir_path)
+        # Create ZIP with images if they exist (globbing and DEFLATE block)
+        download_file = await asyncio.to_thread(create_zip_with_images, output_file, output_dir_path)
 
         # If we created a ZIP, use that for download
         if download_file != output_file:
-            file_size_zip = download_file.stat().st_size / 1024
+            file_size_zip = (await asyncio.to_thread(download_file.stat)).st_size / 1024
             status_text = (
                 "✅ Conversion complete!\n\n"
                 f"📄 Input: `{pdf_path}`\n"
                 f"📁 Output: `{output_file.name}`\n"
                 f"📦 Download: `{download_file.name}` (HTML + images)\n"
                 f"📊 Size: {file_size:.1f} KB (HTML), {file_size_zip:.1f} KB (ZIP)\n\n"
-                f"📝 Log:\n{stdout}\n\n"
+                f"📝 Log:\n{result.stdout}\n\n"
                 "📥 File ready for download below! (ZIP contains HTML + images folder)"
             )
         else:
@@ -267,72 +639,96 @@ def handle_convert(pdf_file, output_dir, no_images, no_toc, keep_toc_pages):
                 f"📄 Input: `{pdf_path}`\n"
                 f"📁 Output: `{output_file.name}`\n"
                 f"📊 Size: {file_size:.1f} KB\n\n"
-                f"📝 Log:\n{stdout}\n\n"
+                f"📝 Log:\n{result.stdout}\n\n"
                 "📥 File ready for download below!"
             )
 
-        return status_text, gr.update(value=str(download_file), visible=True)
+        download = gr.update(value=str(download_file), visible=True)
+        yield status_text, download, no_preview
+        async for preview in read_preview(output_file):
+            yield status_text, download, gr.update(value=preview, visible=True)
     else:
-        return (
+        yield (
             "❌ Output file not found!\n\n"
             f"📄 Input: `{pdf_path}`\n"
             f"📁 Output directory: `{output_dir_path}`\n\n"
-            f"Searched for: {pdf_name}*.html"
-        ), gr.update(value=None, visible=False)
+            f"Expected: {output_file.name}"
+        ), gr.update(value=None, visible=False), no_preview
 
-def handle_batch(folder_path, output_dir, no_images, no_toc, keep_toc_pages):
-    """Handle batch folder conversion."""
+async def handle_batch(folder_path, output_dir, no_images, no_toc, keep_toc_pages):
+    """Handle batch folder conversion, streaming progress as files finish."""
     if not folder_path:
-        return "❌ No folder path provided", gr.update(value=None, visible=False)
+        yield "❌ No folder path provided", gr.update(value=None, visible=False)
+        return
 
     folder = folder_path.strip()
 
-    if not os.path.isdir(folder):
-        return f"❌ Folder not found: {folder}", gr.update(value=None, visible=False)
-
-    stdout, stderr, returncode = convert_folder(folder_path, output_dir, no_images, no_toc, keep_toc_pages)
-
-    if returncode != 0:
-        return (
+    if not await asyncio.to_thread(os.path.isdir, folder):
+        yield f"❌ Folder not found: {folder}", gr.update(value=None, visible=False)
+        return
+
+    yield f"🔍 Scanning {folder}...", gr.update(value=None, visible=False)
+    # Directory walks can stall on large trees or network mounts
+    pdf_paths = await asyncio.to_thread(find_pdfs, folder)
+    total = len(pdf_paths)
+
+    if not total:
+        yield f"❌ No PDF files found in: {folder}", gr.update(value=None, visible=False)
+        return
+
+    log_lines = []
+    failures = []
+    done = 0
+    yield f"⏳ Converting {total} PDFs ({BATCH_WORKERS} at a time)...", gr.update(value=None, visible=False)
+
+    # Files can finish in quick bursts; coalesce them into one update per tick
+    results = convert_folder(folder, pdf_paths, output_dir, no_images, no_toc, keep_toc_pages)
+    async with aclosing(results), aclosing(coalesce(results)) as batches:
+        async for finished in batches:
+            for pdf, result in finished:
+                done += 1
+                if isinstance(result, Exception):
+                    failures.append(pdf)
+                    log_lines.append(f"❌ {pdf.name}: {result}")
+                elif not result.ok:
+                    failures.append(pdf)
+                    log_lines.append(f"❌ {pdf.name} (exit code {result.returncode}):\n{result.stderr.strip()}")
+                else:
+                    log_lines.append(result.stdout.strip())
+            if done < total:
+                log = "\n".join(log_lines)
+                yield f"⏳ {done}/{total} done\n\n📝 Log:\n{log}", gr.update(value=None, visible=False)
+
+    log = "\n".join(log_lines)
+    if len(failures) == total:
+        yield (
             "❌ Batch conversion failed!\n\n"
             f"📁 Input folder: `{folder}`\n"
-            f"📁 Output dir: `{output_dir}`\n"
-            f"🔴 Exit code: {returncode}\n"
-            f"❓ Error output:\n{stderr}\n"
-            f"📝 Standard output:\n{stdout}"
+            f"📁 Output dir: `{output_dir}`\n\n"
+            f"📝 Log:\n{log}"
         ), gr.update(value=None, visible=False)
+        return
 
-    output_dir_path = Path(output_dir)
-    html_files = list(output_dir_path.glob("**/index.html"))
-
-    if html_files:
-        return (
-            "✅ Batch conversion complete!\n\n"
-            f"📁 Folder: {folder}\n"
-            f"📁 Output: {output_dir}\n"
-            f"📊 Generated: {len(html_files)} HTML files\n\n"
-            f"📝 Log:\n{stdout}\n\n"
-            "📥 Browse output directory for individual files"
-        ), gr.update(value=None, visible=False)
-    else:
-        return (
-            "❌ No HTML files found in output directory!\n\n"
-            f"📁 Input folder: {folder}\n"
-            f"📁 Output directory: `{output_dir_path}`\n"
-            f"📝 Log:\n{stdout}\n"
-            f"❓ Error output:\n{stderr}"
-        ), gr.update(value=None, visible=False)
+    status = "✅ Batch conversion complete!" if not failures else "⚠️ Batch conversion finished with errors"
+    yield (
+        f"{status}\n\n"
+        f"📁 Folder: {folder}\n"
+        f"📁 Output: {output_dir}\n"
+        f"📊 Generated: {total - len(failures)}/{total} HTML files\n\n"
+        f"📝 Log:\n{log}\n\n"
+        "📥 Browse output directory for individual files"
+    ), gr.update(value=None, visible=False)
+
+# Built once at import so `gradio gradio_app.py` reload mode can find it
+demo = create_ui()
 
 if __name__ == "__main__":
     print(f"✅ Converter found: {CONVERTER_SCRIPT}")
-    demo = create_ui()
     demo.launch(
         server_name="0.0.0.0",
         server_port=7860,
         share=False,
         show_error=True,
-        theme=gr.themes.Soft(),
-        css="""
-        #status-box textarea {font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;}
-        """
+        theme=APP_THEME,
+        css=APP_CSS
     )
@@ -4,14 +4,21 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import math
 import os
 import re
 import statistics
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass
 from html import escape
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -39,6 +46,7 @@ BULLET_RE = re.compile(r"^\s*[\u2022\u2023\u25E6\u2043\u2219\-\u2013\u2014]\s+")
 FIG_RE = re.compile(r"^(Obr\.|Fig\.|Figure)\s*\d+", re.IGNORECASE)
 LEADER_RE = re.compile(r"(?:\s+(?:\.{3,}|(?:·\s*){3,}|(?:•\s*){3,}|(?:⋅\s*){3,}))\s*\d+\s*$")
 TOC_LEADER_MIN = 5
+PARALLEL_PAGE_THRESHOLD = 64  # Smaller documents aren't worth the extra processes
 
 
 STYLE_BLOCK = """
@@ -163,10 +171,10 @@ def load_metadata(path: Optional[str]) -> dict:
     return data
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Convert PDFs to semantic HTML with SEO-friendly markup.")
-    parser.add_argument("input", help="PDF file or directory containing PDFs")
+    parser.add_argument("input", nargs="?", help="PDF file or directory containing PDFs")
     parser.add_argument("--out", default="out", help="Output directory or HTML file")
     parser.add_argument("--batch", action="store_true", help="Force batch mode for directories")
     parser.add_argument("--recursive", action="store_true", help="Search PDF files recursively")
@@ -183,7 +191,16 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--description", help="Short description / abstract")
     parser.add_argument("--keywords", help="Comma-separated keywords")
     parser.add_argument("--metadata", help="Path to JSON metadata overrides")
-    return parser.parse_args()
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Processes for page text extraction on large PDFs")
+    parser.add_argument("--progress", action="store_true",
+                        help="Print a line as each conversion stage finishes")
+    parser.add_argument("--server", action="store_true",
+                        help="Serve JSON conversion jobs from stdin, one per line")
+    args = parser.parse_args(argv)
+    if not args.server and not args.input:
+        parser.error("the following arguments are required: input")
+    return args
 
 
 def require_fitz():
@@ -196,6 +213,64 @@ def require_fitz():
     return fitz
 
 
+def page_text_dict(page) -> dict:
+    """Text dict with image blocks reduced to placeholders (bbox + xref, no bytes).
+
+    Image bytes are loaded later, one image at a time, so extracted pages stay
+    small enough to keep in memory and to pass between processes.
+    """
+    fitz = require_fitz()
+    text_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES)
+    blocks = text_dict.setdefault("blocks", [])
+    for info in page.get_image_info(xrefs=True):
+        blocks.append({"type": 1, "number": info.get("number"), "bbox": info.get("bbox"), "xref": info.get("xref")})
+    blocks.sort(key=lambda blk: blk.get("number", 0))
+    return text_dict
+
+
+def load_inline_images(page) -> Dict[int, Tuple[bytes, str]]:
+    # Inline images have no xref, so decode the page's image blocks (once per page)
+    return {
+        block.get("number"): (block.get("image"), block.get("ext", "png"))
+        for block in page.get_text("dict").get("blocks", [])
+        if block.get("type") == 1
+    }
+
+
+def extract_page_range(pdf_path: str, start: int, stop: int) -> List[dict]:
+    fitz = require_fitz()
+    with fitz.open(pdf_path) as doc:
+        return [page_text_dict(doc[index]) for index in range(start, stop)]
+
+
+def load_page_dicts(
+    doc,
+    pdf_path: Path,
+    jobs: int,
+    jobs_done: Optional[Callable[[], None]] = None,
+) -> List[dict]:
+    """Extract every page's text dict once, split across processes for large PDFs.
+
+    ``jobs_done`` is called as soon as the extra processes are no longer
+    needed: right away if the document is too small to split, otherwise once
+    the extraction processes have exited.
+    """
+    page_count = len(doc)
+    if jobs <= 1 or page_count < PARALLEL_PAGE_THRESHOLD:
+        if jobs_done:
+            jobs_done()
+        return [page_text_dict(page) for page in doc]
+    step = math.ceil(page_count / jobs)
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+    with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+        chunks = pool.map(extract_page_range, repeat(str(pdf_path)), starts, stops)
+        page_dicts = [page_dict for chunk in chunks for page_dict in chunk]
+    if jobs_done:
+        jobs_done()
+    return page_dicts
+
+
 def collect_pdf_paths(input_path: Path, recursive: bool) -> List[Path]:
     if input_path.is_file() and input_path.suffix.lower() == ".pdf":
         return [input_path]
@@ -307,6 +382,7 @@ def extract_title_candidate(lines: List[Line], body_size: float) -> Optional[str
 
 def build_nodes(
     doc,
+    page_dicts: List[dict],
     body_size: float,
     include_images: bool,
     title_line: Optional[str],
@@ -360,14 +436,13 @@ def build_nodes(
         pending_size = size
 
     for page_index in range(len(doc)):
-        page = doc[page_index]
-        text_dict = page.get_text("dict")
-        blocks = list(text_dict.get("blocks", []))
+        blocks = list(page_dicts[page_index].get("blocks", []))
         blocks.sort(key=lambda blk: ((blk.get("bbox") or [0, 0, 0, 0])[1], (blk.get("bbox") or [0, 0, 0, 0])[0]))
         page_is_toc = page_looks_like_toc(blocks)
         if page_is_toc and not include_toc_pages:
             continue
         page_start_idx = len(nodes)
+        inline_images: Optional[Dict[int, Tuple[bytes, str]]] = None
         for block in blocks:
             block_type = block.get("type")
             if block_type == 1 and include_images:
@@ -375,6 +450,10 @@ def build_nodes(
                 image_bytes = block.get("image")
                 ext = block.get("ext", "png")
                 xref = block.get("xref")
+                if not image_bytes and not xref:
+                    if inline_images is None:
+                        inline_images = load_inline_images(doc[page_index])
+                    image_bytes, ext = inline_images.get(block.get("number"), (None, "png"))
                 if not image_bytes and xref:
                     image = doc.extract_image(xref)
                     image_bytes = image.get("image")
@@ -641,47 +720,58 @@ def convert_pdf(
     schema_type: str,
     include_toc: bool,
     include_toc_pages: bool,
+    jobs: int = 1,
+    progress: bool = False,
+    jobs_done: Optional[Callable[[], None]] = None,
 ) -> None:
+    def report(message: str) -> None:
+        if progress:
+            print(f"{pdf_path.name}: {message}", flush=True)
+
     fitz = require_fitz()
-    doc = fitz.open(pdf_path)
-    pdf_meta = doc.metadata or {}
-    if not meta.get("author") and pdf_meta.get("author"):
-        meta["author"] = pdf_meta.get("author")
-    if not meta.get("title") and pdf_meta.get("title"):
-        meta["title"] = pdf_meta.get("title")
-    span_sizes: List[float] = []
-    for page in doc:
-        for block in page.get_text("dict").get("blocks", []):
-            if block.get("type") != 0:
-                continue
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    span_sizes.append(span.get("size", 0.0))
-    body_size = median(span_sizes, default=12.0)
-
-    # Title candidate from first page
-    title_line = None
-    if len(doc) > 0:
-        first_page = doc[0]
-        first_lines = []
-        for block in first_page.get_text("dict").get("blocks", []):
-            if block.get("type") != 0:
-                continue
-            first_lines.extend(extract_lines_from_block(block))
-        title_line = extract_title_candidate(first_lines, body_size)
-
-    title = meta.get("title") or title_line or pdf_path.stem
-    meta.setdefault("title", title)
-
-    image_dir = output_html.parent / "images" if include_images else None
-    nodes = build_nodes(
-        doc,
-        body_size,
-        include_images,
-        title_line if title_line == title else None,
-        image_dir,
-        include_toc_pages=include_toc_pages,
-    )
+    # Close explicitly: --server workers run many jobs in one long-lived process
+    with fitz.open(pdf_path) as doc:
+        report(f"extracting text from {len(doc)} pages")
+        page_dicts = load_page_dicts(doc, pdf_path, jobs, jobs_done)
+        pdf_meta = doc.metadata or {}
+        if not meta.get("author") and pdf_meta.get("author"):
+            meta["author"] = pdf_meta.get("author")
+        if not meta.get("title") and pdf_meta.get("title"):
+            meta["title"] = pdf_meta.get("title")
+        span_sizes: List[float] = []
+        for text_dict in page_dicts:
+            for block in text_dict.get("blocks", []):
+                if block.get("type") != 0:
+                    continue
+                for line in block.get("lines", []):
+                    for span in line.get("spans", []):
+                        span_sizes.append(span.get("size", 0.0))
+        body_size = median(span_sizes, default=12.0)
+
+        # Title candidate from first page
+        title_line = None
+        if len(doc) > 0:
+            first_lines = []
+            for block in page_dicts[0].get("blocks", []):
+                if block.get("type") != 0:
+                    continue
+                first_lines.extend(extract_lines_from_block(block))
+            title_line = extract_title_candidate(first_lines, body_size)
+
+        title = meta.get("title") or title_line or pdf_path.stem
+        meta.setdefault("title", title)
+
+        image_dir = output_html.parent / "images" if include_images else None
+        report("structuring document")
+        nodes = build_nodes(
+            doc,
+            page_dicts,
+            body_size,
+            include_images,
+            title_line if title_line == title else None,
+            image_dir,
+            include_toc_pages=include_toc_pages,
+        )
 
     toc_html = "" if not include_toc else build_toc(nodes)
     body_html = nodes_to_html(nodes)
@@ -693,6 +783,7 @@ def convert_pdf(
 
     schema_json = build_schema(meta, title, schema_type, images)
     html = render_html(title, meta, toc_html, body_html, schema_json)
+    report(f"writing {len(nodes)} blocks")
     output_html.parent.mkdir(parents=True, exist_ok=True)
     output_html.write_text(html, encoding="utf-8")
 
@@ -714,8 +805,79 @@ def apply_overrides(args: argparse.Namespace, meta: dict) -> dict:
     return meta
 
 
+class LineRelay(io.TextIOBase):
+    """Text stream that forwards each completed line as a ``{"line": ...}`` message."""
+
+    def __init__(self, protocol) -> None:
+        super().__init__()
+        self.protocol = protocol
+        self.pending = ""
+
+    def write(self, text: str) -> int:
+        lines = (self.pending + text).split("\n")
+        self.pending = lines.pop()
+        for line in lines:
+            self.protocol.write(json.dumps({"line": line}) + "\n")
+        if lines:
+            self.protocol.flush()
+        return len(text)
+
+    def finish(self) -> None:
+        if self.pending:
+            self.write("\n")
+
+
+def serve() -> None:
+    """Run jobs read from stdin until EOF, keeping PyMuPDF loaded between them.
+
+    Each request line is ``{"argv": [...]}`` with regular CLI arguments. While
+    a job runs, every line it prints is sent as ``{"line": str}``, and
+    ``{"jobs_done": true}`` once it no longer needs its ``--jobs`` processes;
+    the job ends with ``{"returncode": int, "stderr": str}``.
+    """
+    # Replies get a private copy of fd 1; fd 1 itself is pointed at stderr so
+    # stray writes (extraction subprocesses, C libraries) can't corrupt them.
+    sys.stdout.flush()
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    require_fitz()  # Pay the import before the first job, not during it
+
+    def jobs_done() -> None:
+        protocol.write(json.dumps({"jobs_done": True}) + "\n")
+        protocol.flush()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        out, err = LineRelay(protocol), io.StringIO()
+        returncode = 0
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                run(parse_args(json.loads(line)["argv"]), jobs_done)
+            except SystemExit as exc:
+                if isinstance(exc.code, int):
+                    returncode = exc.code
+                elif exc.code is not None:
+                    print(exc.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+        out.finish()
+        reply = {"returncode": returncode, "stderr": err.getvalue()}
+        protocol.write(json.dumps(reply) + "\n")
+        protocol.flush()
+
+
 def main() -> None:
     args = parse_args()
+    if args.server:
+        serve()
+    else:
+        run(args)
+
+
+def run(args: argparse.Namespace, jobs_done: Optional[Callable[[], None]] = None) -> None:
     input_path = Path(args.input).expanduser().resolve()
     output_path = Path(args.out).expanduser().resolve()
     meta = load_metadata(args.metadata)
@@ -729,6 +891,7 @@ def main() -> None:
     batch_mode = args.batch or input_path.is_dir()
     include_images = not args.no_images
     include_toc = not args.no_toc
+    jobs = args.jobs
 
     for pdf in pdf_paths:
         meta_instance = dict(meta)
@@ -749,8 +912,13 @@ def main() -> None:
             args.schema_type,
             include_toc,
             include_toc_pages=args.keep_toc_pages,
+            jobs=jobs,
+            progress=args.progress,
+            jobs_done=jobs_done,
         )
         print(f"Converted: {pdf} -> {output_html}")
+        if jobs_done:
+            jobs = 1  # The extra processes were handed back during the first PDF
 
 
 if __name__ == "__main__":